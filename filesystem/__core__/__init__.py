@@ -49,11 +49,311 @@ from filesystem import __core__
 ```
 """
 
-import requests
-from filesystem import console as fsconsole
+import functools
+import json
+import os
+import re
+import threading
+import time
+
+### orjson is optional: when installed, settings files are decoded and encoded by it instead of 'json'
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+else:
+    def _loads(data):
+        return json.loads(data)
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=4).encode("utf-8")
 
 __version__ = "1.0.4.0"
 
+_VERSION_PART = re.compile(r'\d+')
+
+@functools.lru_cache(maxsize=32)
+def _parse_version(tag):
+    """
+    Converts a release tag (TAG PATTERN: v1.2.3.4) into a tuple of integers, such as (1, 2, 3, 4).
+
+    Tuples compare part by part, so "v2.1.0.0" is correctly older than "v2.10.0.0"
+    and newer than "v2.0.10.0".
+    """
+    return tuple(int(part) for part in _VERSION_PART.findall(tag))
+
+_CURRENT_VERSION = _parse_version(__version__)
+
+CONFIG_DIR = os.path.join(os.path.expanduser("~"), ".filesystempro")
+"""
+Creates a string that represents the path to the folder where FileSystemPro stores its settings and cached data.
+"""
+CONFIG_FILE = os.path.join(CONFIG_DIR, "config.json")
+"""
+Creates a string that represents the path to the FileSystemPro settings file.
+"""
+UPDATE_CACHE_FILE = os.path.join(CONFIG_DIR, "update_cache.json")
+"""
+Creates a string that represents the path to the file that caches the latest release found by the update checker.
+"""
+
+DEFAULT_CONFIG = {
+    "update_checker_enabled": True,
+    "update_check_ttl": 86400,
+}
+"""
+Default settings used when `CONFIG_FILE` does not exist or does not define a key.
+
+- `update_checker_enabled`: Whether FileSystemPro looks for new releases on GitHub.
+- `update_check_ttl`: Seconds the latest release found on GitHub is trusted before asking GitHub again.
+
+Every setting can also be overridden with an environment variable named after it,
+such as `FILESYSTEMPRO_UPDATE_CHECKER_ENABLED=false`.
+"""
+
+_TRUTHY = frozenset(("true", "1", "yes", "on"))
+
+def _to_bool(value):
+    """
+    Converts a setting to a bool: JSON booleans and numbers as they are, strings such as "true", "yes" or "on" as True
+    and any other string as False.
+    """
+    if isinstance(value, (bool, int)):
+        return bool(value)
+    if isinstance(value, str):
+        return value.strip().lower() in _TRUTHY
+    raise TypeError(f"expected a boolean, got {value!r}")
+
+def _to_seconds(value):
+    """
+    Converts a setting to a number of seconds: JSON numbers as they are, strings with `int`.
+    """
+    if isinstance(value, bool):
+        raise TypeError(f"expected a number of seconds, got {value!r}")
+    if isinstance(value, (int, float)):
+        return value
+    return int(value)
+
+_SETTING_CONVERTERS = {
+    "update_checker_enabled": _to_bool,
+    "update_check_ttl": _to_seconds,
+}
+"""
+Converter applied to each known setting, whether it comes from `CONFIG_FILE` or from the environment.
+A value the converter rejects (TypeError or ValueError) is ignored, keeping the value from `DEFAULT_CONFIG`.
+"""
+
+_ENV_OVERRIDES = (
+    ("FILESYSTEMPRO_UPDATE_CHECKER_ENABLED", "update_checker_enabled"),
+    ("FILESYSTEMPRO_UPDATE_CHECK_TTL", "update_check_ttl"),
+)
+"""
+Environment variables that override settings, as (variable, setting) entries.
+"""
+
+_config = None
+_config_lock = threading.RLock()
+_json_file_cache = {}
+
+def _read_json_file(path):
+    """
+    Reads and decodes a JSON file, reusing the previous result while the file is unchanged.
+
+    Results are cached per path together with the file's modification time and size,
+    so reading an unchanged file again costs a single `os.stat` call.
+
+    Returns:
+    The decoded data, or None if the file does not exist or does not hold valid JSON.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        _json_file_cache.pop(path, None)
+        return None
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _json_file_cache.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    try:
+        with open(path, "rb") as f:
+            data = _loads(f.read())
+    except (OSError, ValueError):
+        data = None
+    _json_file_cache[path] = (key, data)
+    return data
+
+def _write_json_file(path, data):
+    """
+    Writes data to a JSON file atomically, skipping the write when the file already holds the same data.
+
+    The content goes to a temporary file in the same folder which then replaces `path` with `os.replace`,
+    so a crash or a concurrent reader never sees a partially written file.
+
+    Returns:
+    bool: True if the file was written, False if it already held the same data.
+
+    Raises:
+    - OSError: If the folder or the file cannot be written.
+    """
+    if _read_json_file(path) == data:
+        return False
+    import tempfile
+    folder = os.path.dirname(path)
+    ### The folder only has to be created on the very first write, so it is not checked up front
+    try:
+        fd, temp_path = tempfile.mkstemp(dir=folder, suffix=".tmp")
+    except FileNotFoundError:
+        os.makedirs(folder, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=folder, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_dumps(data))
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+    finally:
+        _json_file_cache.pop(path, None)
+    return True
+
+def init_config():
+    """
+    Loads the FileSystemPro settings.
+
+    The values stored in `CONFIG_FILE` are merged over `DEFAULT_CONFIG`,
+    and `FILESYSTEMPRO_*` environment variables are merged over both.
+    A missing or unreadable settings file leaves the defaults in place,
+    and so does any value of the wrong type (e.g. `"update_check_ttl": "1d"`).
+    """
+    global _config
+    with _config_lock:
+        config = DEFAULT_CONFIG.copy()
+        loaded = _read_json_file(CONFIG_FILE)
+        if isinstance(loaded, dict):
+            for key, value in loaded.items():
+                _set_setting(config, key, value)
+
+        ### One lookup per known variable
+        for name, key in _ENV_OVERRIDES:
+            value = os.environ.get(name)
+            if value is not None:
+                _set_setting(config, key, value)
+        _config = config
+
+def _set_setting(config, key, value):
+    """
+    Stores a setting in `config` after converting it with its `_SETTING_CONVERTERS` entry.
+    Values that cannot be converted are left out. Settings without a converter are stored as they are.
+    """
+    convert = _SETTING_CONVERTERS.get(key)
+    if convert is None:
+        config[key] = value
+        return
+    try:
+        config[key] = convert(value)
+    except (TypeError, ValueError):
+        pass
+
+def _get_config_ref():
+    """
+    Returns the current settings dict itself, loading it on first use.
+
+    Used inside the module to read settings without copying them. Callers must not modify it.
+    Once loaded, the settings are returned without taking the lock.
+    """
+    config = _config
+    if config is not None:
+        return config
+    with _config_lock:
+        if _config is None:
+            init_config()
+        return _config
+
+def get_config():
+    """
+    Returns a copy of the current FileSystemPro settings, loading them on first use.
+
+    Returns:
+    dict: The current settings.
+    """
+    return _get_config_ref().copy()
+
+def _load_update_cache(user, repo):
+    """
+    Reads the update checker cache for the GitHub repository `user/repo`.
+
+    Returns:
+    dict: The cached data (`latest_tag`, `checked_at` and `etag`), or an empty dict if there is no usable cache
+    or the cache belongs to another repository.
+    """
+    cache = _read_json_file(UPDATE_CACHE_FILE)
+    if not isinstance(cache, dict) or not cache.get("latest_tag") or not isinstance(cache["latest_tag"], str):
+        return {}
+    if cache.get("repository") != f"{user}/{repo}":
+        return {}
+    ### A hand-edited or corrupted cache must never break the import: anything malformed counts as no cache
+    checked_at = cache.get("checked_at", 0)
+    if isinstance(checked_at, bool) or not isinstance(checked_at, (int, float)):
+        return {}
+    etag = cache.get("etag", "")
+    if not isinstance(etag, str):
+        etag = ""
+    return {"latest_tag": cache["latest_tag"], "checked_at": checked_at, "etag": etag}
+
+def _save_update_cache(user, repo, latest_tag, etag=""):
+    """
+    Stores the latest release tag found on GitHub for `user/repo`, stamped with the current time.
+
+    Failing to write the cache is not an error: the next check will simply ask GitHub again.
+    """
+    cache = {
+        "repository": f"{user}/{repo}",
+        "latest_tag": latest_tag,
+        "checked_at": time.time(),
+        "etag": etag or "",
+    }
+    try:
+        _write_json_file(UPDATE_CACHE_FILE, cache)
+    except OSError:
+        pass
+
+@functools.lru_cache(maxsize=None)
+def _notice_parts():
+    """
+    Formats the static pieces of the update notice once, the first time a notice is printed.
+
+    The console module is only imported here, so importing FileSystemPro never loads it.
+
+    Returns:
+    tuple: The console module, the colored "[Notice]" prefix, the current version label and the pip upgrade command.
+    """
+    from filesystem import console as fsconsole
+    return (
+        fsconsole,
+        f"[{fsconsole.foreground.BLUE}Notice{fsconsole.style.RESET_ALL}]",
+        f"{fsconsole.foreground.RED}v{__version__}{fsconsole.style.RESET_ALL}",
+        f"{fsconsole.foreground.GREEN}pip install --upgrade filesystempro{fsconsole.style.RESET_ALL}",
+    )
+
+def _print_update_notice(tag_name):
+    """
+    Prints the console notice telling the user that release `tag_name` is available.
+    Only the new tag is formatted here, the rest comes from `_notice_parts`.
+    """
+    fsconsole, notice_prefix, current_version_text, update_command = _notice_parts()
+    print(f"{notice_prefix}: A new release of FileSystemPro is available: {current_version_text} -> {fsconsole.foreground.GREEN}{tag_name}{fsconsole.style.RESET_ALL}")
+    print(f"{notice_prefix}: To update, run: {update_command}")
+
 def __checkupdates__(user, repo):
     """
     Checks for updates to the FileSystemPro package on GitHub.
@@ -61,6 +361,10 @@ def __checkupdates__(user, repo):
     This function compares the current version of FileSystemPro, defined in the module,
     with the latest release version available on the specified user's GitHub repository.
     If a newer version is found, it notifies the user via the console.
+    The latest release tag is cached in `UPDATE_CACHE_FILE` and reused for `update_check_ttl` seconds,
+    so GitHub is only asked again once the cached value has expired. That request carries the cached ETag,
+    and a "304 Not Modified" answer keeps the cached tag without downloading the release again.
+    If GitHub cannot be reached, the last cached release is used and the next attempt waits another TTL.
 
     Parameters:
     user (str): The GitHub username of the repository owner.
@@ -68,27 +372,195 @@ def __checkupdates__(user, repo):
 
     Returns:
     tuple: A tuple containing the current version and the latest version tag if an update is available.
-           Returns (None, None) if there's an exception during the request.
+           Returns (None, None) if there's an exception during the request and no release was cached before.
+           Returns the current version twice if `update_checker_enabled` is turned off.
     """
-    ### TAG PATTERN: v1.2.3.4
-    current_version_string = ''.join(filter(str.isdigit, __version__))
-    current_version = int(current_version_string)
-    update_version = 0
+    if not _get_config_ref().get("update_checker_enabled", True):
+        return __version__, __version__
 
-    ### Check updates online using 'requests'
-    url = f'https://api.github.com/repos/{user}/{repo}/releases'
-    try:
-        response = requests.get(url)
-    except requests.exceptions.RequestException as err:
-        return None, None
-    releases = response.json()
-    
-    for release in releases:
-        if update_version == 0:
-            tag_name = f'{release["tag_name"]}'
-            update_version_string = ''.join(filter(str.isdigit, tag_name))
-            update_version = int(update_version_string)
-
-    if current_version < update_version:
-        print(f"[{fsconsole.foreground.BLUE}Notice{fsconsole.style.RESET_ALL}]: A new release of FileSystemPro is available: {fsconsole.foreground.RED}v{__version__}{fsconsole.style.RESET_ALL} -> {fsconsole.foreground.GREEN}{tag_name}{fsconsole.style.RESET_ALL}")
-        print(f"[{fsconsole.foreground.BLUE}Notice{fsconsole.style.RESET_ALL}]: To update, run: {fsconsole.foreground.GREEN}pip install --upgrade filesystempro{fsconsole.style.RESET_ALL}")
\ No newline at end of file
+    ### Reuse the release found by a recent check instead of asking GitHub again
+    cache = _load_update_cache(user, repo)
+    if cache and time.time() - cache.get("checked_at", 0) < _get_config_ref()["update_check_ttl"]:
+        tag_name = cache["latest_tag"]
+        update_version = _parse_version(tag_name)
+    else:
+        ### Check updates online using the standard library HTTP client
+        ### Imported here so that disabled or cached checks never load it
+        from urllib.error import HTTPError, URLError
+        from urllib.request import Request, urlopen
+        ### Sending the previous ETag lets GitHub answer "304 Not Modified" with an empty body
+        url = f'https://api.github.com/repos/{user}/{repo}/releases/latest'
+        headers = {
+            "User-Agent": f"FileSystemPro/{__version__}",
+            "Accept": "application/vnd.github+json",
+        }
+        if cache.get("etag"):
+            headers["If-None-Match"] = cache["etag"]
+        status = None
+        etag = ""
+        release_data = None
+        try:
+            with urlopen(Request(url, headers=headers), timeout=5) as response:
+                status = response.status
+                etag = response.headers.get("ETag", "")
+                release_data = _loads(response.read())
+        except HTTPError as err:
+            status = err.code
+        except (URLError, OSError, ValueError):
+            ### URLError covers DNS and connection failures, ValueError a body that is not JSON
+            pass
+
+        if status == 304 and cache:
+            tag_name = cache["latest_tag"]
+            _save_update_cache(user, repo, tag_name, cache["etag"])
+        elif isinstance(release_data, dict) and release_data.get("tag_name"):
+            tag_name = f'{release_data["tag_name"]}'
+            _save_update_cache(user, repo, tag_name, etag)
+        elif cache:
+            ### GitHub is unreachable or refused the request (e.g. rate limit):
+            ### keep using the last known release and wait a full TTL before asking again
+            tag_name = cache["latest_tag"]
+            _save_update_cache(user, repo, tag_name, cache.get("etag", ""))
+        else:
+            return None, None
+        update_version = _parse_version(tag_name)
+
+    if _CURRENT_VERSION < update_version:
+        _print_update_notice(tag_name)
+    return __version__, tag_name
+
+def _update_check_due(user, repo):
+    """
+    Tells whether an update check for `user/repo` would have to ask GitHub.
+
+    Returns:
+    bool: False if the update checker is turned off or the cached release is still fresh, True otherwise.
+    """
+    config = _get_config_ref()
+    if not config.get("update_checker_enabled", True):
+        return False
+    cache = _load_update_cache(user, repo)
+    return not cache or time.time() - cache.get("checked_at", 0) >= config["update_check_ttl"]
+
+_update_queue = None
+_update_worker_lock = threading.Lock()
+_pending_checks = {}
+_exit_hook_registered = False
+
+### Longest time (in seconds) the interpreter waits at exit for update checks that are still running
+_EXIT_WAIT = 3
+
+def _update_worker():
+    """
+    Runs the update checks queued by `check_updates_async`, one at a time, for the life of the process.
+    """
+    while True:
+        future, user, repo = _update_queue.get()
+        if not future.set_running_or_notify_cancel():
+            continue
+        try:
+            future.set_result(__checkupdates__(user, repo))
+        except BaseException as err:
+            future.set_exception(err)
+
+def _forget_pending_check(key, future):
+    """
+    Removes a finished check from `_pending_checks`, unless a newer check for the same repository replaced it.
+    """
+    with _update_worker_lock:
+        if _pending_checks.get(key) is future:
+            del _pending_checks[key]
+
+def _wait_for_pending_checks():
+    """
+    Waits up to `_EXIT_WAIT` seconds for the update checks that are still running when the interpreter exits.
+
+    The worker is a daemon thread, so without this a short script would exit before GitHub answers:
+    the notice would never be printed and the cache never written, and every run would ask GitHub again.
+    """
+    with _update_worker_lock:
+        pending = list(_pending_checks.values())
+    if pending:
+        import concurrent.futures
+        concurrent.futures.wait(pending, timeout=_EXIT_WAIT)
+
+def _reset_update_worker():
+    """
+    Forgets the update worker in a process created by `os.fork`.
+
+    Only the forking thread survives in the child, so the worker thread, its queue and the checks it was running
+    are gone. The next check in the child starts a new worker instead of waiting on the parent's.
+    """
+    global _update_queue, _update_worker_lock, _pending_checks
+    _update_queue = None
+    ### The lock may have been held by another thread at the time of the fork
+    _update_worker_lock = threading.Lock()
+    _pending_checks = {}
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_update_worker)
+
+def check_updates_async(user, repo):
+    """
+    Checks for updates to the FileSystemPro package without blocking the caller.
+
+    The network request to GitHub runs in a single background daemon thread, started on first use
+    and reused by every later check. At exit, the interpreter waits up to `_EXIT_WAIT` seconds for checks still running,
+    so the result of a check started by a short script is still cached. A check requested while another one for the same repository
+    is still pending shares the pending one instead of queueing a second request.
+    When no request is needed (the update checker is turned off or the cached release is still fresh),
+    the check is answered from the cache right away, nothing is queued and the returned future is already done.
+
+    Parameters:
+    user (str): The GitHub username of the repository owner.
+    repo (str): The name of the repository.
+
+    Returns:
+    concurrent.futures.Future: The future holding the result of `__checkupdates__`.
+    """
+    global _update_queue, _exit_hook_registered
+    import concurrent.futures
+    if not _update_check_due(user, repo):
+        future = concurrent.futures.Future()
+        try:
+            future.set_result(__checkupdates__(user, repo))
+        except Exception as err:
+            future.set_exception(err)
+        return future
+    ### Only needed when a check goes to the network
+    import queue
+    with _update_worker_lock:
+        pending = _pending_checks.get((user, repo))
+        if pending is not None and not pending.done():
+            return pending
+        if _update_queue is None:
+            _update_queue = queue.Queue()
+            threading.Thread(target=_update_worker, name="filesystempro-update", daemon=True).start()
+            ### Forked children inherit the hook, so it is only registered once
+            if not _exit_hook_registered:
+                import atexit
+                atexit.register(_wait_for_pending_checks)
+                _exit_hook_registered = True
+        future = concurrent.futures.Future()
+        _pending_checks[(user, repo)] = future
+        future.add_done_callback(lambda done, key=(user, repo): _forget_pending_check(key, done))
+        _update_queue.put((future, user, repo))
+        return future
+
+async def check_updates(user, repo):
+    """
+    Checks for updates to the FileSystemPro package from a coroutine.
+
+    `check_updates_async` is called from the event loop's default executor, so reading the cache never blocks the loop,
+    and the request itself runs on the shared background thread instead of a thread per call.
+
+    Parameters:
+    user (str): The GitHub username of the repository owner.
+    repo (str): The name of the repository.
+
+    Returns:
+    tuple: The result of `__checkupdates__`.
+    """
+    import asyncio
+    future = await asyncio.get_running_loop().run_in_executor(None, check_updates_async, user, repo)
+    return await asyncio.wrap_future(future)
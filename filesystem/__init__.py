@@ -11,7 +11,7 @@ manage file paths.
 
 Here's a brief description of what the code does:
 
-1. `User Identification:` It identifies the current user using the `getpass.getuser()`
+1. `User Identification:` On first access, it identifies the current user using the `getpass.getuser()`
 function and stores the username with the first letter capitalized.
 
 2. `Platform Identification:` It identifies the platform (OS) using `sys.platform`. 
@@ -21,179 +21,232 @@ Depending on whether the platform is Linux, macOS, or Windows, it sets up differ
 Documents, Downloads, Music, Pictures, Public, and Videos.
 The paths are formed using the user's home directory path and the standard directory names for each platform.
 
-   - For `Linux`, it uses the `/home/{username}` directory as the base.
-   - For `macOS`, it uses the `/Users/{username}` directory as the base.
+   - For `Linux` and `macOS`, it uses the user's home directory (`$HOME`, usually `/home/{username}` or `/Users/{username}`) as the base.
    - For `Windows`, it uses the `USERPROFILE` environment variable to get the base directory.
 
 4. `Special Directories:` Apart from the common directories, it also sets up paths for some
 special directories based on the platform. For example, `Templates` in Linux, `Applications` and
 `Movies` in macOS, and several `AppData` related paths in Windows.
 
+The user name and folder paths are computed the first time they are read and then cached in the module.
+
 This library can be useful for scripts that need to work with user files and need to be compatible across
 different operating systems. 
 It provides an easy way to get the correct file paths regardless of the platform.
 """
 
+import functools
 import getpass
 import os
+import typing
 from sys import platform as PLATFORM
 
+__all__ = [
+    "PLATFORM_NAME",
+    "CURRENT_LOCATION",
+    "OS_SEPARATOR",
+    "USER_NAME",
+    "user",
+    "desktop",
+    "documents",
+    "downloads",
+    "music",
+    "pictures",
+    "public",
+    "videos",
+    "linux_templates",
+    "mac_applications",
+    "mac_movies",
+    "windows_applicationData",
+    "windows_favorites",
+    "windows_localappdata",
+    "windows_temp",
+]
+
 ## VERIFY IF THE LIBRARY HAS SOME AVAILABLE UPDATE
 from filesystem import __core__
-__core__.__checkupdates__("Hbisneto","FileSystemPro")
+__core__.check_updates_async("Hbisneto","FileSystemPro")
 ## VERIFY IF THE LIBRARY HAS SOME AVAILABLE UPDATE
 
-CURRENT_LOCATION = os.getcwd()
-"""
-Creates a string that represents the path to the current directory. (Where the application is running)
-"""
 OS_SEPARATOR = os.sep
 """
 The os.sep is an attribute in the os module in Python. It represents the character that is used by the operating system to separate pathname components, and it varies between different operating systems.
 
 For instance, on Windows, it would return a backslash (\\), while on Unix or Linux, it would return a forward slash (/). So, OS_SEPARATOR will contain the appropriate file path separator for the operating system on which the Python script is running. This is useful for creating file paths in a cross-platform compatible way.
 
-"""
-USER_NAME = getpass.getuser()[0].upper() + getpass.getuser()[1:]
-"""
-Creates a string that represents the username of the user currently logged in to the system.
 """
 
-if PLATFORM == "linux" or PLATFORM == "linux2":
-    PLATFORM_NAME = "Linux"
-    user = f'/home/{os.environ["USER"]}'
-    """
-    Creates a string that represents the path to the current user's home directory.
-    """
-    desktop = f'{user}/Desktop'
-    """
-    Creates a string that represents the path to the current user's Desktop folder.
-    """
-    documents = f'{user}/Documents'
-    """
-    Creates a string that represents the path to the current user's Documents folder.
-    """
-    downloads = f'{user}/Downloads'
-    """
-    Creates a string that represents the path to the current user's Downloads folder.
-    """
-    music = f'{user}/Music'
-    """
-    Creates a string that represents the path to the current user's Music folder.
-    """
-    pictures = f'{user}/Pictures'
-    """
-    Creates a string that represents the path to the current user's Pictures folder.
-    """
-    public = f'{user}/Public'
-    """
-    Creates a string that represents the path to the current user's Public folder.
-    """
-    videos = f'{user}/Videos'
-    """
-    Creates a string that represents the path to the current user's Videos folder.
-    """
-elif PLATFORM == "darwin":
-    PLATFORM_NAME = "macOS"
-    user = f'/Users/{os.environ["USER"]}'
+def _get_posix_user():
+    ### Reads $HOME, falling back to the password database, so custom home folders are honored
+    return os.path.expanduser("~")
+
+def _get_windows_user():
+    return os.environ.get('USERPROFILE') or os.path.expanduser("~")
+
+def _get_windows_public():
+    ### PUBLIC normally points to the Public folder next to the user folders (e.g. C:\Users\Public)
+    return os.environ.get('PUBLIC') or os.path.join(os.path.dirname(_lazy("user")), "Public")
+
+### Platform name, home folder builder, public folder builder and Videos folder name for each `sys.platform`
+_PLATFORMS = {
+    "linux": ("Linux", _get_posix_user, None, "Videos"),
+    "darwin": ("macOS", _get_posix_user, None, "Movies"),
+    "win32": ("Windows", _get_windows_user, _get_windows_public, "Videos"),
+}
+### Older Python versions report Linux as 'linux2'
+PLATFORM_NAME, _get_user, _get_public, _VIDEOS_FOLDER = _PLATFORMS["linux" if PLATFORM.startswith("linux") else PLATFORM]
+
+def _get_user_name():
+    login_name = _lazy("_LOGIN_NAME")
+    return login_name[:1].upper() + login_name[1:]
+
+def _get_user_folder(folder):
+    return _lazy("user") + "/" + folder
+
+### Folders inside the current user's home directory, by attribute name
+_USER_FOLDERS = {
+    "desktop": "Desktop",
+    "documents": "Documents",
+    "downloads": "Downloads",
+    "music": "Music",
+    "pictures": "Pictures",
+    "public": "Public",
+    "videos": _VIDEOS_FOLDER,
+    "linux_templates": "Templates",
+    "mac_applications": "Applications",
+    "mac_movies": "Movies",
+    "windows_applicationData": "AppData/Roaming",
+    "windows_favorites": "Favorites",
+    "windows_localappdata": "AppData/Local",
+    "windows_temp": "AppData/Local/Temp",
+}
+
+_LAZY_ATTRIBUTES = {
+    "_LOGIN_NAME": getpass.getuser,
+    "USER_NAME": _get_user_name,
+    "user": _get_user,
+}
+for _name, _folder in _USER_FOLDERS.items():
+    _LAZY_ATTRIBUTES[_name] = functools.partial(_get_user_folder, _folder)
+if _get_public is not None:
+    _LAZY_ATTRIBUTES["public"] = _get_public
+del _name, _folder
+
+### Declared for type checkers and IDEs only: at run time these names are built on first read by __getattr__
+if typing.TYPE_CHECKING:
+    CURRENT_LOCATION: str
+    """
+    Creates a string that represents the path to the current directory. (Where the application is running)
+    """
+    USER_NAME: str
+    """
+    Creates a string that represents the username of the user currently logged in to the system.
+    """
+    user: str
     """
     Creates a string that represents the path to the current user's home directory.
     """
-    desktop = f'{user}/Desktop'
+    desktop: str
     """
     Creates a string that represents the path to the current user's Desktop folder.
     """
-    documents = f'{user}/Documents'
+    documents: str
     """
     Creates a string that represents the path to the current user's Documents folder.
     """
-    downloads = f'{user}/Downloads'
+    downloads: str
     """
     Creates a string that represents the path to the current user's Downloads folder.
     """
-    music = f'{user}/Music'
+    music: str
     """
     Creates a string that represents the path to the current user's Music folder.
     """
-    pictures = f'{user}/Pictures'
+    pictures: str
     """
     Creates a string that represents the path to the current user's Pictures folder.
     """
-    public = f'{user}/Public'
+    public: str
     """
     Creates a string that represents the path to the current user's Public folder.
     """
-    videos = f'{user}/Movies'
+    videos: str
     """
     Creates a string that represents the path to the current user's Videos folder.
     """
-elif PLATFORM == "win32" or PLATFORM == "win64":
-    PLATFORM_NAME = "Windows"
-    user = os.environ['USERPROFILE']
+    linux_templates: str
     """
-    Creates a string that represents the path to the current user's home directory.
+    Creates a string that represents the path to the current user's Templates folder in Linux environment.
     """
-    desktop = f'{user}/Desktop'
+    mac_applications: str
     """
-    Creates a string that represents the path to the current user's Desktop folder.
+    Creates a string that represents the path to the current user's Applications folder in macOS environment.
     """
-    documents = f'{user}/Documents'
+    mac_movies: str
     """
-    Creates a string that represents the path to the current user's Documents folder.
+    Creates a string that represents the path to the current user's Movies folder in macOS environment.
+
+    - Tip: Use `fs.videos` instead:
+
+    ```
+    import filesystem as fs
+    print(fs.videos)
+    ```
     """
-    downloads = f'{user}/Downloads'
+    windows_applicationData: str
     """
-    Creates a string that represents the path to the current user's Downloads folder.
+    Creates a string that represents the path to the current user's Roaming folder inside AppData in Windows environment.
     """
-    music = f'{user}/Music'
+    windows_favorites: str
     """
-    Creates a string that represents the path to the current user's Music folder.
+    Creates a string that represents the path to the current user's Favorites folder in Windows environment.
     """
-    pictures = f'{user}/Pictures'
+    windows_localappdata: str
     """
-    Creates a string that represents the path to the current user's Pictures folder.
+    Creates a string that represents the path to the current user's Local folder inside AppData in Windows environment.
     """
-    public = os.environ['PUBLIC']
+    windows_temp: str
     """
-    Creates a string that represents the path to the current user's Public folder.
-    """
-    videos = f'{user}/Videos'
+    Creates a string that represents the path to the current user's Temp folder inside LocalAppData in Windows environment.
     """
-    Creates a string that represents the path to the current user's Videos folder.
+
+def __getattr__(name):
     """
+    Computes the user name and folder paths the first time they are read.
 
-linux_templates = f'{user}/Templates'
-"""
-Creates a string that represents the path to the current user's Templates folder in Linux environment.
-"""
-mac_applications = f'{user}/Applications'
-"""
-Creates a string that represents the path to the current user's Applications folder in macOS environment.
-"""
-mac_movies = f'{user}/Movies'
-"""
-Creates a string that represents the path to the current user's Movies folder in macOS environment.
+    Reading `fs.desktop`, `fs.USER_NAME`, `fs.user` or any other user folder builds the value once
+    and stores it in the module, so later reads are plain attribute lookups.
+    Importing FileSystem therefore no longer looks up the user or builds every path up front.
 
-- Tip: Use `fs.videos` instead:
+    `CURRENT_LOCATION` is the exception: it is read again on every access, so it follows `os.chdir`.
 
-```
-import filesystem as fs
-print(fs.videos)
-```
-"""
-windows_applicationData = f'{user}/AppData/Roaming'
-"""
-Creates a string that represents the path to the current user's Roaming folder inside AppData in Windows environment.
-"""
-windows_favorites = f'{user}/Favorites'
-"""
-Creates a string that represents the path to the current user's Favorites folder in Windows environment.
-"""
-windows_localappdata = f'{user}/AppData/Local'
-"""
-Creates a string that represents the path to the current user's Local folder inside AppData in Windows environment.
-"""
-windows_temp = f'{windows_localappdata}/Temp'
-"""
-Creates a string that represents the path to the current user's Temp folder inside LocalAppData in Windows environment.
-"""
\ No newline at end of file
+    - `CURRENT_LOCATION`: The path to the current directory. (Where the application is running)
+    - `USER_NAME`: The username of the user currently logged in to the system.
+    - `user`: The path to the current user's home directory.
+    - `desktop`, `documents`, `downloads`, `music`, `pictures`, `public`, `videos`:
+    The paths to the current user's common folders.
+    - `linux_templates`: The path to the Templates folder in Linux environment.
+    - `mac_applications`, `mac_movies`: The paths to the Applications and Movies folders in macOS environment.
+    - `windows_applicationData`, `windows_favorites`, `windows_localappdata`, `windows_temp`:
+    The paths to the Roaming, Favorites, Local and Temp folders in Windows environment.
+    """
+    if name == "CURRENT_LOCATION":
+        return os.getcwd()
+    builder = _LAZY_ATTRIBUTES.get(name)
+    if builder is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = builder()
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | {"CURRENT_LOCATION"})
+
+def _lazy(name):
+    """
+    Returns a lazily computed attribute, computing it if it was not read yet.
+    """
+    try:
+        return globals()[name]
+    except KeyError:
+        return __getattr__(name)
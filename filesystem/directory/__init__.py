@@ -58,9 +58,9 @@ import shutil
 import filesystem as fs
 from filesystem import wrapper as wra
 
-def combine(*args, paths=[]):
+def combine(*args, paths=None):
     """
-    # directory.combine(*args, paths=[])
+    # directory.combine(*args, paths=None)
 
     ---
 
@@ -69,7 +69,7 @@ def combine(*args, paths=[]):
 
     ### Parameters:
     *args (str): The paths to combine. The first argument must be an absolute path.
-    paths (list): A list of paths to combine. The first element in the list must be an absolute path. Defaults to an empty list.
+    paths (list): A list of paths to combine. The first element in the list must be an absolute path. Defaults to None (no list).
 
     ### Returns:
     str: The combined path.
@@ -374,9 +374,9 @@ def get_parent_name(path):
         return os.path.basename(path)
     return os.path.basename(os.path.dirname(path))
 
-def join(path1='', path2='', path3='', path4='', paths=[]):
+def join(path1='', path2='', path3='', path4='', paths=None):
     """
-    # directory.join(path1='', path2='', path3='', path4='', paths=[])
+    # directory.join(path1='', path2='', path3='', path4='', paths=None)
 
     ---
 
@@ -385,7 +385,7 @@ def join(path1='', path2='', path3='', path4='', paths=[]):
 
     ### Parameters:
     path1, path2, path3, path4 (str): The directory paths to join. Defaults to an empty string.
-    paths (list): A list of additional directory paths to join. Defaults to an empty list.
+    paths (list): A list of additional directory paths to join. Defaults to None (no additional paths).
 
     ### Returns:
     str: The joined directory path.
@@ -60,9 +60,53 @@ import hashlib
 import os
 import shutil
 import filesystem as fs
-from filesystem import directory as dir
 from filesystem import wrapper as wra
 
+### Read/write size used when streaming file contents (1 MB): large enough to keep the number of system calls low
+_BUFFER_SIZE = 1024 * 1024
+
+def _copy_file_contents(source_file, destination_file, count=None):
+    """
+    Copies `count` bytes (everything, if None) from the current position of `source_file`
+    to the current position of `destination_file`, and moves `source_file` past the copied bytes.
+
+    Where `os.sendfile` works between two files (Linux), the data is copied inside the kernel without passing
+    through Python. Otherwise, or if `os.sendfile` fails, the rest is copied in 1 MB blocks, so a file is never held
+    in memory as a whole.
+
+    Returns:
+    int: The number of bytes copied, lower than `count` only when the end of `source_file` was reached.
+    """
+    start = offset = source_file.tell()
+    remaining = count
+    if hasattr(os, "sendfile"):
+        destination_file.flush()
+        try:
+            while remaining is None or remaining > 0:
+                ### A single sendfile call copies at most about 2 GB
+                block = min(remaining, 1 << 30) if remaining is not None else 1 << 30
+                sent = os.sendfile(destination_file.fileno(), source_file.fileno(), offset, block)
+                if sent == 0:
+                    break
+                offset += sent
+                if remaining is not None:
+                    remaining -= sent
+            source_file.seek(offset)
+            return offset - start
+        except OSError:
+            ### e.g. macOS, where the destination must be a socket
+            source_file.seek(offset)
+    if remaining is None:
+        shutil.copyfileobj(source_file, destination_file, _BUFFER_SIZE)
+        return source_file.tell() - start
+    while remaining > 0:
+        data = source_file.read(min(_BUFFER_SIZE, remaining))
+        if not data:
+            break
+        destination_file.write(data)
+        remaining -= len(data)
+    return source_file.tell() - start
+
 def append_text(file, text):
     """
     # file.append_text(file, text)
@@ -121,8 +165,8 @@ def calculate_checksum(file):
     """
     sha256_hash = hashlib.sha256()
     with open(file, "rb") as f:
-        # Read and update hash in chunks of 4K
-        for byte_block in iter(lambda: f.read(4096), b""):
+        # Read and update hash in chunks of 1 MB
+        for byte_block in iter(lambda: f.read(_BUFFER_SIZE), b""):
             sha256_hash.update(byte_block)
     return sha256_hash.hexdigest()
 
@@ -306,7 +350,9 @@ def enumerate_files(file):
     file = os.path.expanduser(file)
     for root, dirs, files in os.walk(file):
         results.append(wra.get_object(root))
-        results.extend([wra.get_object(dir.join(root,x)) for x in files])
+        ### The separator is added once per folder instead of joining every file name
+        prefix = root if root.endswith(os.sep) else root + os.sep
+        results.extend([wra.get_object(prefix + x) for x in files])
     return results
 
 def exists(file):
@@ -553,7 +599,7 @@ def reassemble_file(large_file, new_file):
         with open(new_file, 'wb') as output_file:
             for part in parts:
                 with open(part, 'rb') as part_file:
-                    output_file.write(part_file.read())
+                    _copy_file_contents(part_file, output_file)
             
         for part in parts:
             delete(part)
@@ -577,6 +623,7 @@ def split_file(file, chunk_size = 1048576):
     ### Raises:
     - FileNotFoundError: If the file does not exist.
     - PermissionError: If the permission is denied.
+    - ValueError: If `chunk_size` is not a positive number of bytes.
 
     ### Examples:
     - Splits a file into 1 MB chunks.
@@ -590,16 +637,21 @@ def split_file(file, chunk_size = 1048576):
     split_file("large_file", 512000)  # splits into 500 KB chunks
     ```
     """
+    if chunk_size <= 0:
+        raise ValueError(f"[FileSystemPro.split_file.ValueError]: chunk_size must be greater than 0, got {chunk_size}.")
+
     if exists(file) == False:
         return False
 
     with open(file, 'rb') as f:
-        chunk = f.read(chunk_size)
+        size = os.fstat(f.fileno()).st_size
         i = 0
-        while chunk:
+        while f.tell() < size:
             with open(f'{file}.fsp{str(i)}', 'wb') as chunk_file:
-                chunk_file.write(chunk)
+                copied = _copy_file_contents(f, chunk_file, chunk_size)
             i += 1
-            chunk = f.read(chunk_size)
+            ### The file ended earlier than expected (it shrank while being split)
+            if copied < chunk_size:
+                break
     return True
 
@@ -12,6 +12,7 @@ It includes functions for retrieving metadata, checking file extensions, and cre
 - `Metadata Retrieval:` Gathers comprehensive metadata about a file or directory path.
 - `Extension Check:` Determines whether a file has an extension.
 - `Zip Archive Creation:` Packages a directory or file into a zip archive.
+- `Zip Archive Listing:` Lists the files inside a zip archive, all at once or one at a time.
 
 ## Detailed Functionality
 The module's functions are crafted to offer detailed insights into the file system and to perform common 
@@ -47,16 +48,16 @@ import datetime
 import glob
 import os
 import shutil
+import stat
 from filesystem import file as fsfile
-from filesystem import directory as dir
 import zipfile
 
 ### wrapper.combine() kept to cover version support. Remove on (MAJOR UPDATE ONLY)
-def combine(*args, paths=[]):
+def combine(*args, paths=None):
     """
-    # wrapper.combine(*args, paths=[])
+    # wrapper.combine(*args, paths=None)
     - #### Under support
-        - Consider using `directory.combine(*args, paths=[])`
+        - Consider using `directory.combine(*args, paths=None)`
 
     ---
 
@@ -65,7 +66,7 @@ def combine(*args, paths=[]):
 
     ### Parameters:
     *args (str): The paths to combine. The first argument must be an absolute path.
-    paths (list): A list of paths to combine. The first element in the list must be an absolute path. Defaults to an empty list.
+    paths (list): A list of paths to combine. The first element in the list must be an absolute path. Defaults to None (no list).
 
     ### Returns:
     str: The combined path.
@@ -279,7 +280,9 @@ def enumerate_files(path):
     path = os.path.expanduser(path)
     for root, dirs, files in os.walk(path):
         results.append(get_object(root))
-        results.extend([get_object(join(root,x)) for x in files])
+        ### The separator is added once per folder instead of joining every file name
+        prefix = root if root.endswith(os.sep) else root + os.sep
+        results.extend([get_object(prefix + x) for x in files])
     return results
 
 def find_duplicates(path):
@@ -316,8 +319,9 @@ def find_duplicates(path):
     duplicate_files = []
 
     for root, dirs, files in os.walk(path):
+        prefix = root if root.endswith(os.sep) else root + os.sep
         for file in files:
-            file_path = dir.join(root, file)
+            file_path = prefix + file
             checksum = fsfile.calculate_checksum(file_path)
             if checksum in checksums:
                 original_files.append(checksums[checksum])
@@ -528,6 +532,30 @@ def get_object(path):
     result["size"] = get_size(path)
     return result
 
+def _get_directory_size(path):
+    """
+    Adds up the sizes of all files below the directory `path`.
+
+    Directories are listed with `os.scandir`, so each file is measured from its directory entry
+    without joining and resolving its path again. Like `os.walk`, symbolic links to directories are not followed
+    and directories that cannot be listed are skipped.
+    """
+    size = 0
+    pending = [path]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        pending.append(entry.path)
+                else:
+                    size += entry.stat().st_size
+    return size
+
 def get_size(file_path):
     """
     # wrapper.get_size(path)
@@ -565,11 +593,7 @@ def get_size(file_path):
     if os.path.isfile(file_path):
         size = os.path.getsize(file_path)
     else:
-        size = sum(
-            os.path.getsize(os.path.join(dirpath, filename)) 
-                for dirpath, dirnames, filenames in os.walk(file_path)
-                    for filename in filenames
-        )
+        size = _get_directory_size(file_path)
     
     for unit in ['bytes', 'KB', 'MB', 'GB', 'TB']:
         if size < 1024.0:
@@ -609,11 +633,11 @@ def has_extension(file_path):
     return os.path.splitext(file_path)[1] != ''
 
 ### wrapper.join() kept to cover version support. Remove on (MAJOR UPDATE ONLY)
-def join(path1='', path2='', path3='', path4='', paths=[]):
+def join(path1='', path2='', path3='', path4='', paths=None):
     """
-    # wrapper.join(path1='', path2='', path3='', path4='', paths=[])
+    # wrapper.join(path1='', path2='', path3='', path4='', paths=None)
     - #### Under support
-        - Consider using `directory.join(path1='', path2='', path3='', path4='', paths=[])`
+        - Consider using `directory.join(path1='', path2='', path3='', path4='', paths=None)`
     ---
 
     ### Overview
@@ -621,7 +645,7 @@ def join(path1='', path2='', path3='', path4='', paths=[]):
 
     ### Parameters:
     path1, path2, path3, path4 (str): The directory paths to join. Defaults to an empty string.
-    paths (list): A list of additional directory paths to join. Defaults to an empty list.
+    paths (list): A list of additional directory paths to join. Defaults to None (no additional paths).
 
     ### Returns:
     str: The joined directory path.
@@ -730,18 +754,88 @@ def list_files(path):
             file_list.append(file)
     return file_list
 
-def make_zip(source, destination):
+### Extensions of file formats that are already compressed, stored in zip archives as they are
+_COMPRESSED_EXTENSIONS = frozenset((
+    ".7z", ".aac", ".avi", ".bz2", ".docx", ".flac", ".gif", ".gz", ".heic", ".jar", ".jpeg", ".jpg",
+    ".lz4", ".m4a", ".mkv", ".mov", ".mp3", ".mp4", ".ogg", ".png", ".pptx", ".rar", ".tgz", ".webm",
+    ".webp", ".xlsx", ".xz", ".zip", ".zst",
+))
+
+### ZipFile.open(..., "w") only reads the compression level from the ZipInfo, and ZipInfo has no public way to set it
+### before Python 3.13, so ZipFile.write sets the private `_compresslevel` itself.
+### Python 3.13 renamed it to `compress_level`, keeping `_compresslevel` only as an alias.
+_ZIPINFO_LEVEL_ATTRIBUTE = "compress_level" if hasattr(zipfile.ZipInfo, "compress_level") else "_compresslevel"
+
+def _iter_zip_entries(path, arcname, path_stat):
+    """
+    Yields `(path, arcname, file_stat)` for the directory `path` and everything below it:
+    the directory itself, its files, then each subdirectory, all sorted by name.
+
+    Each entry is listed once with `os.scandir` and its `stat` result is handed on,
+    so the archive entry can be built without looking the file up again.
+    Symbolic links to directories are added as empty directories and are not followed.
+    Only regular files (or links to them) are archived, as `shutil.make_archive` does:
+    broken links, FIFOs, sockets and devices are skipped.
+    """
+    yield path, arcname + "/", path_stat
+    files = []
+    directories = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                directories.append(entry)
+            elif entry.is_file():
+                files.append(entry)
+    for entry in sorted(files, key=lambda entry: entry.name):
+        yield entry.path, arcname + "/" + entry.name, entry.stat()
+    for entry in sorted(directories, key=lambda entry: entry.name):
+        if entry.is_symlink():
+            yield entry.path, arcname + "/" + entry.name + "/", entry.stat()
+        else:
+            yield from _iter_zip_entries(entry.path, arcname + "/" + entry.name, entry.stat())
+
+def _write_zip_entry(zip_file, path, arcname, file_stat):
     """
-    # wrapper.make_zip(source, destination)
+    Adds one file or directory to an open zip archive using an already known `stat` result.
+    This builds the same entry as `ZipFile.write`, but file contents are copied in 1 MB blocks and files in an already compressed format are stored without compression.
+    """
+    zip_info = zipfile.ZipInfo(arcname, datetime.datetime.fromtimestamp(file_stat.st_mtime).timetuple()[:6])
+    zip_info.external_attr = (file_stat.st_mode & 0xFFFF) << 16
+    if arcname.endswith("/"):
+        ### MS-DOS directory flag
+        zip_info.external_attr |= 0x10
+        zip_file.writestr(zip_info, b"")
+        return
+    zip_info.file_size = file_stat.st_size
+    if os.path.splitext(arcname)[1].lower() in _COMPRESSED_EXTENSIONS:
+        ### Deflating data that is already compressed costs time without making it smaller
+        zip_info.compress_type = zipfile.ZIP_STORED
+    else:
+        zip_info.compress_type = zip_file.compression
+        setattr(zip_info, _ZIPINFO_LEVEL_ATTRIBUTE, zip_file.compresslevel)
+    with open(path, "rb") as source_file, zip_file.open(zip_info, "w") as zip_entry:
+        shutil.copyfileobj(source_file, zip_entry, fsfile._BUFFER_SIZE)
+
+def make_zip(source, destination, compression=zipfile.ZIP_DEFLATED, compresslevel=None):
+    """
+    # wrapper.make_zip(source, destination, compression=zipfile.ZIP_DEFLATED, compresslevel=None)
 
     ---
 
     ### Overview
     Creates a zip archive of the specified source directory or file and moves it to the specified destination.
+    A `.zip` destination is written in place, file by file, without a temporary archive in the current directory.
+    Files are deflated, except for formats that are already compressed (images, audio, video, archives),
+    which are stored as they are.
 
     ### Parameters:
     source (str): The path of the directory or file to archive.
     destination (str): The path where the archive will be moved to.
+    compression (int): The zip compression method (`zipfile.ZIP_DEFLATED`, `zipfile.ZIP_BZIP2`,
+    `zipfile.ZIP_LZMA` or `zipfile.ZIP_STORED`). None stores files without compression. Defaults to `zipfile.ZIP_DEFLATED`.
+    compresslevel (int): The compression level, from 1 (fastest) to 9 (smallest) for `ZIP_DEFLATED` and `ZIP_BZIP2`.
+    Lower levels write text-heavy archives much faster for a slightly bigger file. Defaults to None (the method's default, 6 for `ZIP_DEFLATED`).
+    Both are only used for `.zip` destinations.
 
     ### Returns:
     None
@@ -762,18 +856,67 @@ def make_zip(source, destination):
     ```python
     make_zip("/path/to/file.txt", "/path/to/file.zip")
     ```
+    - Creates a zip archive quickly, trading some compression for speed.
+
+    ```python
+    make_zip("/path/to/directory", "/path/to/directory.zip", compresslevel=1)
+    ```
     """
     base = os.path.basename(destination)
     name = base.split('.')[0]
     format = base.split('.')[1]
     archive_from = os.path.dirname(source)
     archive_to = os.path.basename(source.strip(os.sep))
-    shutil.make_archive(name, format, archive_from, archive_to)
-    shutil.move('%s.%s'%(name,format), destination)
+    if format != "zip":
+        shutil.make_archive(name, format, archive_from, archive_to)
+        shutil.move('%s.%s'%(name,format), destination)
+        return
+
+    ### Zip archives are written straight to the destination instead of being built in the current folder and moved
+    ### A single stat both checks that the source exists (raising FileNotFoundError) and feeds its archive entry
+    source_stat = os.stat(source)
+    destination_path = os.path.abspath(destination)
+    if compression is None:
+        compression = zipfile.ZIP_STORED
+    ### Opened outside the cleanup below: if ZipFile itself fails (e.g. an unsupported compression method
+    ### or a destination that is a directory), the destination was not touched and must be left as it is
+    zip_file = zipfile.ZipFile(destination, "w", compression, allowZip64=True, compresslevel=compresslevel)
+    try:
+        with zip_file:
+            if not stat.S_ISDIR(source_stat.st_mode):
+                _write_zip_entry(zip_file, source, archive_to, source_stat)
+                return
+            ### Walking from the absolute source makes every entry path absolute and normalized already,
+            ### so it can be compared to the destination without calling os.path.abspath per entry
+            for path, arcname, file_stat in _iter_zip_entries(os.path.abspath(source), archive_to, source_stat):
+                ### Never add the archive being written to itself
+                if path == destination_path:
+                    continue
+                _write_zip_entry(zip_file, path, arcname, file_stat)
+    except BaseException:
+        ### Removes the partial archive written by this call
+        try:
+            os.remove(destination)
+        except OSError:
+            pass
+        raise
+
+### Names of the folders and files that operating systems add to archives on their own
+_COMPRESSION_SYSTEM_FOLDER = "__MACOSX/"
+_COMPRESSION_SYSTEM_FILES = (".DS_Store", "Thumbs.db")
+_COMPRESSION_SYSTEM_SUFFIXES = tuple("/" + name for name in _COMPRESSION_SYSTEM_FILES)
+
+def _is_compression_system_file(name):
+    """
+    Tells whether an archive entry is one of the files operating systems add when compressing.
+    """
+    return (name.startswith(_COMPRESSION_SYSTEM_FOLDER)
+            or name in _COMPRESSION_SYSTEM_FILES
+            or name.endswith(_COMPRESSION_SYSTEM_SUFFIXES))
 
-def read_zip_file_contents(zip_filename):
+def read_zip_file_contents(zip_filename, show_compression_system_files=True):
     """
-    # wrapper.read_zip_file_contents(zip_filename)
+    # wrapper.read_zip_file_contents(zip_filename, show_compression_system_files=True)
 
     ---
     
@@ -782,6 +925,8 @@ def read_zip_file_contents(zip_filename):
 
     ### Parameters:
     zip_filename (str): The path to the ZIP file to read.
+    show_compression_system_files (bool): If False, leaves out the files added by operating systems
+    when compressing (`__MACOSX/` folders, `.DS_Store` and `Thumbs.db`). Defaults to True.
 
     ### Returns:
     list: A list of filenames contained in the ZIP file.
@@ -796,12 +941,54 @@ def read_zip_file_contents(zip_filename):
     ```python
     read_zip_file_contents("/path/to/zipfile.zip")
     ```
+    - Reads the contents of a ZIP file without the system files added when compressing.
+
+    ```python
+    read_zip_file_contents("/path/to/zipfile.zip", show_compression_system_files=False)
+    ```
     """
     try:
         with zipfile.ZipFile(zip_filename, "r") as zip_file:
             zip_contents_list = zip_file.namelist()
-            return zip_contents_list
+            if show_compression_system_files:
+                return zip_contents_list
+            return [name for name in zip_contents_list if not _is_compression_system_file(name)]
     except FileNotFoundError:
         return "[FileSystem Pro]: File Not Found"
     except Exception as e:
         return f"[FileSystem Pro]: An error occurred. Error: {e}"
+
+def iter_zip_file_contents(zip_filename, show_compression_system_files=True):
+    """
+    # wrapper.iter_zip_file_contents(zip_filename, show_compression_system_files=True)
+
+    ---
+    
+    ### Overview
+    Reads the contents of a ZIP file and yields the names of the files contained within it, one at a time.
+    Unlike `read_zip_file_contents`, no list of every name is built, which keeps memory low for archives
+    with a very large number of entries and lets a search stop at the first match.
+
+    ### Parameters:
+    zip_filename (str): The path to the ZIP file to read.
+    show_compression_system_files (bool): If False, leaves out the files added by operating systems
+    when compressing (`__MACOSX/` folders, `.DS_Store` and `Thumbs.db`). Defaults to True.
+
+    ### Returns:
+    generator: The filenames contained in the ZIP file. The file stays open until the generator is exhausted or closed.
+
+    ### Raises:
+    - FileNotFoundError: If the ZIP file does not exist.
+    - zipfile.BadZipFile: If the file is not a ZIP file.
+
+    ### Examples:
+    - Checks whether a ZIP file contains any CSV file, without listing all of its contents.
+
+    ```python
+    any(name.endswith(".csv") for name in iter_zip_file_contents("/path/to/zipfile.zip"))
+    ```
+    """
+    with zipfile.ZipFile(zip_filename, "r") as zip_file:
+        for zip_info in zip_file.infolist():
+            if show_compression_system_files or not _is_compression_system_file(zip_info.filename):
+                yield zip_info.filename
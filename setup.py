@@ -29,9 +29,7 @@ setup(
         'Programming Language :: Python :: 3.12',
     ],
     description = u'FileSystemPro is a powerful toolkit designed to handle file and directory operations with ease and efficiency across various operating systems.',
-    install_requires = [
-        'requests',
-    ],
+    install_requires = [],
     long_description = readme,
     long_description_content_type = "text/markdown",
     keywords = ['FileSystem', 
@@ -0,0 +1,4 @@
+import os
+
+### Importing filesystem starts an update check; the tests must never ask GitHub
+os.environ["FILESYSTEMPRO_UPDATE_CHECKER_ENABLED"] = "false"
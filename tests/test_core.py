@@ -0,0 +1,152 @@
+import io
+import json
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from filesystem import __core__ as core
+
+USER, REPO = "Hbisneto", "FileSystemPro"
+
+
+class FakeResponse:
+    def __init__(self, body, etag="", status=200):
+        self.status = status
+        self.headers = {"ETag": etag}
+        self._body = json.dumps(body).encode("utf-8")
+
+    def read(self):
+        return self._body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+@pytest.fixture
+def checker(tmp_path, monkeypatch):
+    """
+    Points the update cache at a temporary file, turns the checker on and records every request sent to GitHub.
+    Tests set `checker.answer` to a FakeResponse, or to an exception to raise.
+    """
+    monkeypatch.setattr(core, "UPDATE_CACHE_FILE", str(tmp_path / "update_cache.json"))
+    monkeypatch.setattr(core, "_config", {"update_checker_enabled": True, "update_check_ttl": 86400})
+    monkeypatch.setattr(core, "_json_file_cache", {})
+
+    class Checker:
+        answer = None
+        requests = []
+
+    def fake_urlopen(request, timeout=None):
+        Checker.requests.append(request)
+        if isinstance(Checker.answer, BaseException):
+            raise Checker.answer
+        return Checker.answer
+
+    Checker.requests = []
+    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+    return Checker
+
+
+def read_cache():
+    with open(core.UPDATE_CACHE_FILE) as f:
+        return json.load(f)
+
+
+def age_cache(seconds):
+    cache = read_cache()
+    cache["checked_at"] -= seconds
+    with open(core.UPDATE_CACHE_FILE, "w") as f:
+        json.dump(cache, f)
+
+
+def test_new_release_is_cached_and_announced(checker, capsys):
+    checker.answer = FakeResponse({"tag_name": "v9.0.0.0"}, etag='"abc"')
+    assert core.__checkupdates__(USER, REPO) == (core.__version__, "v9.0.0.0")
+    assert "v9.0.0.0" in capsys.readouterr().out
+    cache = read_cache()
+    assert cache["repository"] == f"{USER}/{REPO}"
+    assert cache["latest_tag"] == "v9.0.0.0"
+    assert cache["etag"] == '"abc"'
+
+
+def test_older_release_prints_nothing(checker, capsys):
+    checker.answer = FakeResponse({"tag_name": "v1.0.0.0"})
+    assert core.__checkupdates__(USER, REPO) == (core.__version__, "v1.0.0.0")
+    assert capsys.readouterr().out == ""
+
+
+def test_fresh_cache_skips_the_request(checker):
+    checker.answer = FakeResponse({"tag_name": "v1.0.0.0"})
+    core.__checkupdates__(USER, REPO)
+    checker.answer = FakeResponse({"tag_name": "v2.0.0.0"})
+    assert core.__checkupdates__(USER, REPO) == (core.__version__, "v1.0.0.0")
+    assert len(checker.requests) == 1
+    assert not core._update_check_due(USER, REPO)
+
+
+def test_expired_cache_asks_again_with_the_etag(checker):
+    checker.answer = FakeResponse({"tag_name": "v1.0.0.0"}, etag='"abc"')
+    core.__checkupdates__(USER, REPO)
+    age_cache(86400)
+    assert core._update_check_due(USER, REPO)
+    checker.answer = FakeResponse({"tag_name": "v2.0.0.0"}, etag='"def"')
+    assert core.__checkupdates__(USER, REPO) == (core.__version__, "v2.0.0.0")
+    assert checker.requests[-1].get_header("If-none-match") == '"abc"'
+    assert read_cache()["etag"] == '"def"'
+
+
+def test_not_modified_keeps_the_cached_release(checker):
+    checker.answer = FakeResponse({"tag_name": "v1.0.0.0"}, etag='"abc"')
+    core.__checkupdates__(USER, REPO)
+    age_cache(86400)
+    checker.answer = urllib.error.HTTPError("url", 304, "Not Modified", {}, io.BytesIO())
+    assert core.__checkupdates__(USER, REPO) == (core.__version__, "v1.0.0.0")
+    cache = read_cache()
+    assert cache["etag"] == '"abc"'
+    assert time.time() - cache["checked_at"] < 60
+
+
+def test_failure_falls_back_to_the_cached_release(checker):
+    checker.answer = FakeResponse({"tag_name": "v1.0.0.0"})
+    core.__checkupdates__(USER, REPO)
+    age_cache(86400)
+    checker.answer = urllib.error.URLError("offline")
+    assert core.__checkupdates__(USER, REPO) == (core.__version__, "v1.0.0.0")
+    ### The failed attempt is recorded, so the next one waits a full TTL
+    assert not core._update_check_due(USER, REPO)
+
+
+def test_failure_without_cache(checker):
+    checker.answer = urllib.error.URLError("offline")
+    assert core.__checkupdates__(USER, REPO) == (None, None)
+    checker.answer = urllib.error.HTTPError("url", 403, "rate limited", {}, io.BytesIO())
+    assert core.__checkupdates__(USER, REPO) == (None, None)
+
+
+def test_cache_of_another_repository_is_ignored(checker):
+    checker.answer = FakeResponse({"tag_name": "v1.0.0.0"})
+    core.__checkupdates__(USER, REPO)
+    checker.answer = FakeResponse({"tag_name": "v2.0.0.0"})
+    assert core.__checkupdates__(USER, "Other") == (core.__version__, "v2.0.0.0")
+    assert len(checker.requests) == 2
+
+
+def test_disabled_checker_sends_nothing(checker):
+    core._config["update_checker_enabled"] = False
+    assert core.__checkupdates__(USER, REPO) == (core.__version__, core.__version__)
+    assert checker.requests == []
+    future = core.check_updates_async(USER, REPO)
+    assert future.done()
+    assert future.result() == (core.__version__, core.__version__)
+
+
+def test_check_updates_async_runs_in_the_background(checker):
+    checker.answer = FakeResponse({"tag_name": "v1.0.0.0"})
+    future = core.check_updates_async(USER, REPO)
+    assert future.result(timeout=5) == (core.__version__, "v1.0.0.0")
+    assert len(checker.requests) == 1
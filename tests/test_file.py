@@ -0,0 +1,47 @@
+import os
+
+import pytest
+
+from filesystem import file as fsfile
+
+
+def test_split_file_rejects_non_positive_chunk_size(tmp_path):
+    source = tmp_path / "data.bin"
+    source.write_bytes(b"0123456789")
+    for chunk_size in (0, -1):
+        with pytest.raises(ValueError):
+            fsfile.split_file(str(source), chunk_size)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["data.bin"]
+
+
+@pytest.mark.parametrize("size, chunk_size", [
+    (0, 4),
+    (1, 1),
+    (10, 1),
+    (10, 3),
+    (12, 4),
+    (10, 10),
+    (10, 11),
+    (3 * 1048576 + 5, 1048576),
+])
+def test_split_and_reassemble_round_trip(tmp_path, size, chunk_size):
+    data = os.urandom(size)
+    source = tmp_path / "data.bin"
+    source.write_bytes(data)
+    assert fsfile.split_file(str(source), chunk_size) is True
+
+    parts = sorted((p for p in tmp_path.iterdir() if p.name.startswith("data.bin.fsp")),
+                   key=lambda p: int(p.name.rsplit("fsp", 1)[1]))
+    assert len(parts) == -(-size // chunk_size)
+    assert b"".join(p.read_bytes() for p in parts) == data
+    assert all(p.stat().st_size == chunk_size for p in parts[:-1])
+
+    rebuilt = tmp_path / "rebuilt.bin"
+    fsfile.reassemble_file(str(source), str(rebuilt))
+    if size:
+        assert rebuilt.read_bytes() == data
+    assert not any(p.name.startswith("data.bin.fsp") for p in tmp_path.iterdir())
+
+
+def test_split_missing_file(tmp_path):
+    assert fsfile.split_file(str(tmp_path / "missing.bin"), 4) is False
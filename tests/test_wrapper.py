@@ -0,0 +1,89 @@
+import os
+import shutil
+import zipfile
+
+import pytest
+
+from filesystem import wrapper as wra
+
+
+@pytest.fixture
+def source(tmp_path):
+    root = tmp_path / "src"
+    (root / "sub" / "deeper").mkdir(parents=True)
+    (root / "empty").mkdir()
+    (root / "a.txt").write_text("hello " * 1000)
+    (root / "photo.jpg").write_bytes(os.urandom(2048))
+    (root / "sub" / "b.txt").write_text("b")
+    (root / "sub" / "deeper" / "c.bin").write_bytes(b"\0" * 4096)
+    return root
+
+
+def make_both(source, tmp_path):
+    """
+    Archives `source` with make_zip and with shutil.make_archive, returning both open archives.
+    """
+    destination = tmp_path / "out" / "src.zip"
+    destination.parent.mkdir()
+    wra.make_zip(str(source), str(destination))
+    reference = shutil.make_archive(str(tmp_path / "reference"), "zip", str(source.parent), source.name)
+    return zipfile.ZipFile(destination), zipfile.ZipFile(reference)
+
+
+def test_make_zip_matches_make_archive(source, tmp_path):
+    archive, reference = make_both(source, tmp_path)
+    with archive, reference:
+        assert sorted(archive.namelist()) == sorted(reference.namelist())
+        for name in reference.namelist():
+            assert archive.read(name) == reference.read(name)
+        assert archive.testzip() is None
+
+
+def test_make_zip_compression_types(source, tmp_path):
+    destination = tmp_path / "src.zip"
+    wra.make_zip(str(source), str(destination))
+    with zipfile.ZipFile(destination) as archive:
+        assert archive.getinfo("src/a.txt").compress_type == zipfile.ZIP_DEFLATED
+        ### Already compressed formats are stored as they are
+        assert archive.getinfo("src/photo.jpg").compress_type == zipfile.ZIP_STORED
+        assert archive.getinfo("src/sub/").is_dir()
+
+
+def test_make_zip_compression_options(source, tmp_path):
+    stored = tmp_path / "stored.zip"
+    wra.make_zip(str(source), str(stored), compression=None)
+    fast = tmp_path / "fast.zip"
+    wra.make_zip(str(source), str(fast), compresslevel=1)
+    with zipfile.ZipFile(stored) as archive:
+        assert {info.compress_type for info in archive.infolist()} == {zipfile.ZIP_STORED}
+    with zipfile.ZipFile(fast) as archive:
+        assert archive.read("src/a.txt") == (source / "a.txt").read_bytes()
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs FIFOs and symbolic links")
+def test_make_zip_skips_special_files(source, tmp_path):
+    os.mkfifo(source / "pipe")
+    os.symlink(source / "missing", source / "dangling")
+    os.symlink(source / "a.txt", source / "link.txt")
+    archive, reference = make_both(source, tmp_path)
+    with archive, reference:
+        names = archive.namelist()
+        assert "src/pipe" not in names
+        assert "src/dangling" not in names
+        assert archive.read("src/link.txt") == (source / "a.txt").read_bytes()
+        assert sorted(names) == sorted(reference.namelist())
+
+
+def test_make_zip_single_file(source, tmp_path):
+    destination = tmp_path / "a.zip"
+    wra.make_zip(str(source / "a.txt"), str(destination))
+    with zipfile.ZipFile(destination) as archive:
+        assert archive.namelist() == ["a.txt"]
+
+
+def test_make_zip_failure_keeps_existing_destination(source, tmp_path):
+    destination = tmp_path / "keep.zip"
+    destination.write_bytes(b"keep")
+    with pytest.raises(NotImplementedError):
+        wra.make_zip(str(source), str(destination), compression=99)
+    assert destination.read_bytes() == b"keep"